@@ -23,21 +23,42 @@ export default {
     async annotate(context, payload) {
         const token = context.rootGetters["auth/getToken"];
 
-        const response = await postStream(`http://${ipAddress}:${port}/annotation/annotate`, payload, {
-            'Authorization': token
-        });
+        context.commit('setDownloadedBytes', 0);
 
-        console.log(response);
+        // no timeout here: annotating a large image set can take minutes
+        const response = await fetch(`http://${ipAddress}:${port}/annotation/annotate`, {
+            method: 'POST',
+            headers: {
+                'Authorization': token
+            },
+            body: payload.formData
+        });
 
         if(!response.ok)
         {
-            const error = new Error(`Failed to download files!`);
+            // the picked file was created empty when it was chosen
+            if(payload.fileHandle && payload.fileHandle.remove)
+            {
+                try {
+                    await payload.fileHandle.remove();
+                }
+                catch(_) {
+                    // the browser may refuse; the empty file is then left behind
+                }
+            }
+
+            let detail = null;
+            try {
+                detail = (await response.json()).detail;
+            }
+            catch(_) {
+                detail = null;
+            }
+
+            const error = new Error(detail || `Failed to annotate the images (${response.status})!`);
             throw error;
         }
 
-        // Read the response as a blob
-        const blob = await response.blob();
-
         // Extract filename from Content-Disposition header
         let filename = 'output.zip'; // Default filename
         const disposition = response.headers.get('Content-Disposition');
@@ -49,6 +70,53 @@ export default {
             }
         }
 
+        // The archive is written chunk by chunk as it arrives. With a file
+        // handle it goes straight to disk, otherwise it is kept in memory.
+        const writable = payload.fileHandle ? await payload.fileHandle.createWritable() : null;
+        const chunks = [];
+        const reader = response.body.getReader();
+
+        let downloadedBytes = 0;
+
+        try {
+            while(true)
+            {
+                const { done, value } = await reader.read();
+
+                if(done)
+                {
+                    break;
+                }
+
+                if(writable)
+                {
+                    await writable.write(value);
+                }
+                else
+                {
+                    chunks.push(value);
+                }
+
+                downloadedBytes += value.byteLength;
+                context.commit('setDownloadedBytes', downloadedBytes);
+            }
+        }
+        catch(error) {
+            if(writable)
+            {
+                await writable.abort();
+            }
+            throw error;
+        }
+
+        if(writable)
+        {
+            await writable.close();
+            return;
+        }
+
+        const blob = new Blob(chunks, { type: response.headers.get('Content-Type') || 'application/zip' });
+
         // Create a temporary link to trigger the download
         const url = window.URL.createObjectURL(blob);
         const link = document.createElement('a');
@@ -1,5 +1,9 @@
 export default {
     getModels(state) {
         return state.models;
+    },
+
+    getDownloadedBytes(state) {
+        return state.downloadedBytes;
     }
 }
\ No newline at end of file
@@ -6,7 +6,8 @@ export default {
     namespaced: true,
     state() {
         return {
-            models: []
+            models: [],
+            downloadedBytes: 0
         };
     },
 
@@ -5,5 +5,9 @@ export default {
 
     addModel(state, payload) {
         state.models.push(payload);
+    },
+
+    setDownloadedBytes(state, payload) {
+        state.downloadedBytes = payload;
     }
 }
\ No newline at end of file
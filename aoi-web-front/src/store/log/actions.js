@@ -51,7 +51,13 @@ export default {
 
     async removeEvent(context, payload) {
         const events = context.getters.getEvents;
-        const eventId = events.findIndex(event => event.timestamp === payload.timestamp);
+        const eventId = events.indexOf(payload.event);
+
+        if(eventId === -1)
+        {
+            const error = new Error(`Could not find the event to remove!`);
+            throw error;
+        }
 
         const { response, responseData } = await remove(`http://${ipAddress}:${port}/log/${eventId}`);
 
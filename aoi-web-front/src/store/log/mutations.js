@@ -8,7 +8,6 @@ export default {
     },
 
     removeEvent(state, payload) {
-        const eventId = state.events.findIndex(event => event.id === payload.uid);
-        state.events.splice(eventId, 1);
+        state.events.splice(payload.uid, 1);
     }
 }
\ No newline at end of file
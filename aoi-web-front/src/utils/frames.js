@@ -0,0 +1,91 @@
+/**
+ * Helpers for the binary frame protocol used by the image source websockets.
+ *
+ * A viewer negotiates its stream through query parameters on the socket URL
+ * (codec, quality, target size and fps cap). Frames encoded that way arrive as
+ * binary messages prefixed by a fixed little-endian header:
+ *
+ *  offset  size  field
+ *  0       4     magic 'AOIF'
+ *  4       1     version
+ *  5       1     codec (0 = png, 1 = jpeg, 2 = webp)
+ *  6       2     header length in bytes (payload starts here)
+ *  8       2     source frame width
+ *  10      2     source frame height
+ *  12      4     frame id
+ *  16      8     capture timestamp (ms since epoch, float64)
+ *
+ * Width and height are the dimensions of the grabbed frame before any server
+ * side downscaling, so a viewer can map a reduced payload back to source
+ * pixel coordinates. Messages without the magic are the legacy base64 encoded
+ * PNG frames.
+ *
+ * Downscaling to the viewer size (fitToView) is opt-in: screens that draw or
+ * save regions keep the full resolution stream.
+ */
+
+const FRAME_MAGIC = 'AOIF';
+const FRAME_HEADER_SIZE = 24;
+
+const FRAME_CODECS = ['png', 'jpeg', 'webp'];
+
+const DEFAULT_STREAM_OPTIONS = {
+    codec: 'jpeg',
+    quality: 85,
+    maxFps: 30,
+    fitToView: false
+};
+
+function buildStreamUrl(location, uid, options, viewSize) {
+    const streamOptions = { ...DEFAULT_STREAM_OPTIONS, ...(options || {}) };
+
+    const params = new URLSearchParams({
+        codec: streamOptions.codec,
+        quality: String(streamOptions.quality),
+        max_fps: String(streamOptions.maxFps)
+    });
+
+    if(streamOptions.fitToView && viewSize && viewSize.width > 0 && viewSize.height > 0)
+    {
+        const ratio = window.devicePixelRatio || 1;
+        params.set('max_width', String(Math.round(viewSize.width * ratio)));
+        params.set('max_height', String(Math.round(viewSize.height * ratio)));
+    }
+
+    return `${location}/${uid}?${params.toString()}`;
+}
+
+async function parseFrame(blob) {
+    if(blob.size < FRAME_HEADER_SIZE)
+    {
+        return null;
+    }
+
+    const view = new DataView(await blob.slice(0, FRAME_HEADER_SIZE).arrayBuffer());
+
+    let magic = '';
+    for(let i = 0; i < FRAME_MAGIC.length; i++)
+    {
+        magic += String.fromCharCode(view.getUint8(i));
+    }
+
+    if(magic !== FRAME_MAGIC)
+    {
+        return null;
+    }
+
+    const codec = FRAME_CODECS[view.getUint8(5)] || 'png';
+    const headerLength = view.getUint16(6, true);
+
+    return {
+        version: view.getUint8(4),
+        codec: codec,
+        width: view.getUint16(8, true),
+        height: view.getUint16(10, true),
+        frameId: view.getUint32(12, true),
+        timestamp: view.getFloat64(16, true),
+        payload: blob.slice(headerLength, blob.size, `image/${codec}`)
+    };
+}
+
+export { FRAME_HEADER_SIZE, DEFAULT_STREAM_OPTIONS, buildStreamUrl, parseFrame }